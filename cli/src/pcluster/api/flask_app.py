@@ -25,6 +25,7 @@ from pcluster.api.errors import (
 from pcluster.api.util import assert_valid_node_js
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.common import AWSClientError, Cache
+from pcluster.models.s3_bucket import S3BucketFactory
 
 LOGGER = logging.getLogger(__name__)
 
@@ -96,6 +97,7 @@ class ParallelClusterFlaskApp:
             # Cache is meant to be reused only within a single request
             Cache.clear_all()
             AWSApi.reset()
+            S3BucketFactory.reset()
 
         @self.flask_app.before_request
         def _log_request():  # pylint: disable=unused-variable
@@ -126,10 +126,14 @@ def deserialize_model(data, klass):
     if not instance.openapi_types:
         return data
 
+    if not isinstance(data, (list, dict)):
+        return instance
+
+    attribute_map = instance.attribute_map
     for attr, attr_type in six.iteritems(instance.openapi_types):
-        if data is not None and instance.attribute_map[attr] in data and isinstance(data, (list, dict)):
-            value = data[instance.attribute_map[attr]]
-            setattr(instance, attr, _deserialize(value, attr_type))
+        json_key = attribute_map[attr]
+        if json_key in data:
+            setattr(instance, attr, _deserialize(data[json_key], attr_type))
 
     return instance
 
@@ -11,7 +11,7 @@
 import itertools
 import re
 from datetime import datetime
-from typing import Any, List, Tuple
+from typing import Any, FrozenSet, List, Tuple
 
 from botocore.exceptions import ClientError
 
@@ -47,6 +47,11 @@ class Ec2Client(Boto3Client):
             self.additional_instance_types_data.keys()
         )
 
+    @Cache.cached
+    def get_instance_types_set(self) -> FrozenSet[str]:
+        """Return the instance types of list_instance_types as a set, to check membership in constant time."""
+        return frozenset(self.list_instance_types())
+
     @AWSExceptionHandler.handle_client_exception
     def describe_instance_type_offerings(self, filters=None, location_type=None):
         """Return a list of instance types."""
@@ -121,6 +126,8 @@ class Ec2Client(Boto3Client):
 
     def get_subnets_az_mapping(self, subnet_ids):
         """Return a dictionary mapping the input subnet_ids to their respective availability zones."""
+        # Describe all the subnets with a single call, the lookups by subnet below are then served by subnets_cache
+        self.describe_subnets(list(dict.fromkeys(subnet_ids)))
         return {subnet_id: self.get_subnet_avail_zone(subnet_id) for subnet_id in subnet_ids}
 
     @AWSExceptionHandler.handle_client_exception
@@ -255,11 +262,13 @@ class Ec2Client(Boto3Client):
         return self._client.describe_key_pairs(KeyNames=[key_name])
 
     @AWSExceptionHandler.handle_client_exception
+    @Cache.cached
     def describe_placement_group(self, group_name):
         """Return the given placement group, if exists."""
         return self._client.describe_placement_groups(GroupNames=[group_name])
 
     @AWSExceptionHandler.handle_client_exception
+    @Cache.cached
     def describe_vpc_attribute(self, vpc_id, attribute):
         """Return the attribute of the VPC."""
         return self._client.describe_vpc_attribute(VpcId=vpc_id, Attribute=attribute)
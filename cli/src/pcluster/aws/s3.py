@@ -12,6 +12,9 @@ from botocore.exceptions import ClientError
 
 from pcluster.aws.common import AWSClientError, AWSExceptionHandler, Boto3Client
 
+# Maximum number of keys accepted by a single DeleteObjects request
+DELETE_OBJECTS_MAX_KEYS = 1000
+
 
 class S3Client(Boto3Client):
     """S3 Boto3 client."""
@@ -65,6 +68,42 @@ class S3Client(Boto3Client):
             kwargs["ExpectedBucketOwner"] = expected_bucket_owner
         return self._client.get_object(**kwargs)
 
+    @AWSExceptionHandler.handle_client_exception
+    def delete_object_versions(self, bucket_name, prefix):
+        """
+        Delete all the object versions and delete markers under the given prefix.
+
+        Versions are listed page by page and removed with DeleteObjects requests of at most 1000 keys each.
+        Unversioned objects are listed with a "null" version id, so they are removed as well.
+        """
+        objects = []
+        errors = []
+        for page in self._client.get_paginator("list_object_versions").paginate(Bucket=bucket_name, Prefix=prefix):
+            for version in page.get("Versions", []) + page.get("DeleteMarkers", []):
+                objects.append({"Key": version["Key"], "VersionId": version["VersionId"]})
+                if len(objects) == DELETE_OBJECTS_MAX_KEYS:
+                    errors.extend(self._delete_objects(bucket_name, objects))
+                    objects = []
+        if objects:
+            errors.extend(self._delete_objects(bucket_name, objects))
+
+        if errors:
+            raise AWSClientError(
+                function_name="delete_object_versions",
+                message="Failed to delete {0} object(s) under {1}/{2}: {3}".format(
+                    len(errors),
+                    bucket_name,
+                    prefix,
+                    ", ".join(f"{error.get('Key')} ({error.get('Message')})" for error in errors),
+                ),
+                error_code=errors[0].get("Code"),
+            )
+
+    def _delete_objects(self, bucket_name, objects):
+        """Delete the given objects with a single request and return the per-key errors."""
+        response = self._client.delete_objects(Bucket=bucket_name, Delete={"Objects": objects, "Quiet": True})
+        return response.get("Errors", [])
+
     @AWSExceptionHandler.handle_client_exception
     def get_bucket_versioning_status(self, bucket_name):
         """Return true if bucket versioning is enabled."""
@@ -41,16 +41,6 @@ class S3Resource(Boto3Resource):
         else:
             self.get_bucket(bucket_name).objects.all().delete()
 
-    @AWSExceptionHandler.handle_client_exception
-    def delete_object(self, bucket_name, prefix=None):
-        """Delete object versions by filter."""
-        self.get_bucket(bucket_name).object_versions.filter(Prefix=prefix).delete()
-
-    @AWSExceptionHandler.handle_client_exception
-    def delete_object_versions(self, bucket_name, prefix=None):
-        """Delete object versions by filter."""
-        self.get_bucket(bucket_name).object_versions.filter(Prefix=prefix).delete()
-
     @AWSExceptionHandler.handle_client_exception
     def delete_all_object_versions(self, bucket_name):
         """Delete all object versions."""
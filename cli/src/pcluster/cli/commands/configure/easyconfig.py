@@ -154,7 +154,7 @@ def configure(args):  # noqa: C901
     default_instance_type = AWSApi.instance().ec2.get_default_instance_type()
     head_node_instance_type = prompt(
         "Head node instance type",
-        lambda x: x in AWSApi.instance().ec2.list_instance_types(),
+        lambda x: x in AWSApi.instance().ec2.get_instance_types_set(),
         default_value=default_instance_type,
     )
     if scheduler == "awsbatch":
@@ -209,7 +209,7 @@ def configure(args):  # noqa: C901
                 while True:
                     compute_instance_type = prompt(
                         f"Compute instance type for compute resource {compute_resource_index+1} in {queue_name}",
-                        validator=lambda x: x in AWSApi.instance().ec2.list_instance_types(),
+                        validator=lambda x: x in AWSApi.instance().ec2.get_instance_types_set(),
                         default_value=default_instance_type,
                     )
                     if compute_instance_type not in [
@@ -17,17 +17,27 @@ import json
 import logging
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing
 from enum import Enum
+from functools import lru_cache
 
 import yaml
 
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.common import AWSClientError, get_region
 from pcluster.constants import PCLUSTER_BUCKET_REQUIRED_BOOTSTRAP_FEATURES, PCLUSTER_S3_BUCKET_VERSION
-from pcluster.utils import format_arn, get_partition, get_service_principal, get_url_domain_suffix, yaml_load, zip_dir
+from pcluster.utils import format_arn, get_partition, get_service_principal, get_url_domain_suffix, zip_dir
 
 LOGGER = logging.getLogger(__name__)
 
+# Maximum number of resource files uploaded concurrently by S3Bucket.upload_resources
+RESOURCES_UPLOAD_MAX_WORKERS = 8
+
+# Use the libyaml bindings when available, they produce the same documents as the pure Python implementation
+YAML_DUMPER = getattr(yaml, "CDumper", yaml.Dumper)
+YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class S3FileFormat(Enum):
     """Define S3 file format."""
@@ -111,16 +121,7 @@ class S3Bucket:
         :param region
         :return: ParallelCluster bucket name e.g. parallelcluster-b9033160b61390ef-v1-do-not-delete
         """
-        return "-".join(
-            [
-                "parallelcluster",
-                S3Bucket.generate_s3_bucket_hash_suffix(account_id, region),
-                PCLUSTER_S3_BUCKET_VERSION,
-                "do",
-                "not",
-                "delete",
-            ]
-        )
+        return _get_bucket_name(account_id, region)
 
     @staticmethod
     def generate_s3_bucket_hash_suffix(account_id, region):
@@ -131,7 +132,7 @@ class S3Bucket:
         :param region
         :return: 16 chars string e.g. 2238a84ac8a74529
         """
-        return hashlib.sha256((account_id + region).encode()).hexdigest()[0:16]
+        return _generate_s3_bucket_hash_suffix(account_id, region)
 
     def check_bucket_exists(self):
         """Check bucket existence by bucket name."""
@@ -150,7 +151,9 @@ class S3Bucket:
         )
 
         bucket_policy = self._generate_bucket_policy()
-        AWSApi.instance().s3.put_bucket_policy(bucket_name=self.name, policy=json.dumps(bucket_policy))
+        AWSApi.instance().s3.put_bucket_policy(
+            bucket_name=self.name, policy=format_content(bucket_policy, S3FileFormat.MINIFIED_JSON)
+        )
 
     def _generate_bucket_policy(self):
         """Generate the complete bucket policy for the S3 bucket."""
@@ -256,10 +259,7 @@ class S3Bucket:
         if self.artifact_directory and self._cleanup_on_deletion:
             try:
                 LOGGER.info("Deleting artifacts under %s/%s", self.name, self.artifact_directory)
-                AWSApi.instance().s3_resource.delete_object(bucket_name=self.name, prefix=f"{self.artifact_directory}/")
-                AWSApi.instance().s3_resource.delete_object_versions(
-                    bucket_name=self.name, prefix=f"{self.artifact_directory}/"
-                )
+                AWSApi.instance().s3.delete_object_versions(bucket_name=self.name, prefix=f"{self.artifact_directory}/")
             except AWSClientError as e:
                 LOGGER.warning(
                     "Failed to delete S3 artifact under %s/%s with error %s. Please delete them manually.",
@@ -314,10 +314,23 @@ class S3Bucket:
         return self.upload_file(file_type=S3FileType.CONFIGS, content=config, file_name=config_name, format=format)
 
     def upload_cfn_template(self, template_body, template_name, format=S3FileFormat.YAML):
-        """Upload cloudformation template to S3 bucket."""
-        return self.upload_file(
-            file_type=S3FileType.TEMPLATES, content=template_body, file_name=template_name, format=format
-        )
+        """
+        Upload cloudformation template to S3 bucket.
+
+        The upload is skipped when the latest object stored under the same key already has the same content.
+        """
+        body = format_content(template_body, format)
+        key = self.get_object_key(S3FileType.TEMPLATES, template_name)
+        try:
+            metadata = AWSApi.instance().s3.head_object(bucket_name=self.name, object_name=key)
+            # The ETag of objects uploaded with a single PUT and SSE-S3 encryption is the MD5 of their content
+            if metadata.get("ETag", "").strip('"') == _md5_hexdigest(body):
+                LOGGER.info("Template %s is unchanged, skipping upload.", key)
+                return metadata
+        except AWSClientError as e:
+            LOGGER.debug("Unable to retrieve metadata of template %s: %s", key, e)
+
+        return AWSApi.instance().s3.put_object(bucket_name=self.name, body=body, key=key)
 
     def upload_cfn_asset(self, asset_file_content, asset_name: str, format=S3FileFormat.YAML):
         """Upload cloudformation assets to S3 bucket."""
@@ -332,20 +345,32 @@ class S3Bucket:
         :param resource_dir: resource directory containing the resources to upload.
         :param custom_artifacts_name: custom_artifacts_name for zipped dir
         """
-        for res in os.listdir(resource_dir):
-            path = os.path.join(resource_dir, res)
-            if os.path.isdir(path):
-                AWSApi.instance().s3.upload_fileobj(
-                    file_obj=zip_dir(os.path.join(resource_dir, res)),
-                    bucket_name=self.name,
-                    key=self.get_object_key(S3FileType.CUSTOM_RESOURCES, custom_artifacts_name),
-                )
-            elif os.path.isfile(path):
-                AWSApi.instance().s3.upload_file(
-                    file_path=os.path.join(resource_dir, res),
-                    bucket_name=self.name,
-                    key=self.get_object_key(S3FileType.CUSTOM_RESOURCES, res),
-                )
+        s3_client = AWSApi.instance().s3
+        custom_artifacts_key = self.get_object_key(S3FileType.CUSTOM_RESOURCES, custom_artifacts_name)
+        resource_files = []
+        # scandir entries cache the file type returned by readdir, saving a stat call per entry
+        with os.scandir(resource_dir) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    with zip_dir(entry.path) as zipped_dir:
+                        s3_client.upload_fileobj(file_obj=zipped_dir, bucket_name=self.name, key=custom_artifacts_key)
+                elif entry.is_file():
+                    resource_files.append((entry.name, entry.path))
+
+        if resource_files:
+            # Files are uploaded to distinct keys, so they can be sent concurrently.
+            with ThreadPoolExecutor(max_workers=min(RESOURCES_UPLOAD_MAX_WORKERS, len(resource_files))) as executor:
+                futures = [
+                    executor.submit(
+                        s3_client.upload_file,
+                        file_path=path,
+                        bucket_name=self.name,
+                        key=self.get_object_key(S3FileType.CUSTOM_RESOURCES, res),
+                    )
+                    for res, path in resource_files
+                ]
+                for future in as_completed(futures):
+                    future.result()
 
     def get_config(self, config_name, version_id=None, format=S3FileFormat.TEXT):
         """Get config file from S3 bucket."""
@@ -395,14 +420,16 @@ class S3Bucket:
             bucket_name=self.name, key=self.get_object_key(file_type, file_name), version_id=version_id
         )
 
-        file_content = result["Body"].read().decode("utf-8")
-
-        if format == S3FileFormat.YAML:
-            file = yaml_load(file_content)
-        elif format == S3FileFormat.JSON:
-            file = json.loads(file_content)
-        else:
-            file = file_content
+        # Parse the streaming body directly to avoid holding both the raw bytes and the decoded string in memory
+        with closing(result["Body"]) as body:
+            if format == S3FileFormat.YAML:
+                # A nosec comment is appended to the following line in order to disable the B506 check.
+                # The loader is either yaml.CSafeLoader or yaml.SafeLoader.
+                file = yaml.load(body, Loader=YAML_SAFE_LOADER)  # nosec B506
+            elif format == S3FileFormat.JSON:
+                file = json.load(body)
+            else:
+                file = body.read().decode("utf-8")
         return file
 
     def _get_file_url(self, file_name, file_type):
@@ -425,6 +452,14 @@ class S3Bucket:
 class S3BucketFactory:
     """S3 bucket factory to return a bucket object with existence check and creation."""
 
+    # Names of the default buckets already verified or configured as bootstrapped in this process
+    _bootstrapped_buckets = set()
+
+    @classmethod
+    def reset(cls):
+        """Forget the bootstrapped state of the buckets verified so far."""
+        cls._bootstrapped_buckets.clear()
+
     @classmethod
     def init_s3_bucket(cls, service_name: str, artifact_directory: str, stack_name: str, custom_s3_bucket: str):
         """Initialize the s3 bucket."""
@@ -461,11 +496,16 @@ class S3BucketFactory:
         except AWSClientError as e:
             cls._create_bucket(bucket, e)
 
+        if bucket.name in cls._bootstrapped_buckets:
+            LOGGER.debug("Bucket %s has already been verified as bootstrapped.", bucket.name)
+            return bucket
+
         is_bootstrapped = bucket.check_bucket_is_bootstrapped()
         if not is_bootstrapped:
             cls._configure_bucket(bucket)
         else:
             LOGGER.info("Bucket %s is already bootstrapped with required features.", bucket.name)
+        cls._bootstrapped_buckets.add(bucket.name)
 
         return bucket
 
@@ -491,6 +531,31 @@ class S3BucketFactory:
             raise error
 
 
+def _md5_hexdigest(body):
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    return hashlib.md5(body, usedforsecurity=False).hexdigest()
+
+
+@lru_cache(maxsize=128)
+def _generate_s3_bucket_hash_suffix(account_id, region):
+    return hashlib.sha256((account_id + region).encode()).digest()[:8].hex()
+
+
+@lru_cache(maxsize=128)
+def _get_bucket_name(account_id, region):
+    return "-".join(
+        [
+            "parallelcluster",
+            _generate_s3_bucket_hash_suffix(account_id, region),
+            PCLUSTER_S3_BUCKET_VERSION,
+            "do",
+            "not",
+            "delete",
+        ]
+    )
+
+
 def parse_bucket_url(url):
     """
     Parse s3 url to get bucket name and object name.
@@ -532,7 +597,7 @@ def format_content(content, s3_file_format: S3FileFormat):
     :return:
     """
     if s3_file_format == S3FileFormat.YAML:
-        return yaml.dump(content)
+        return yaml.dump(content, Dumper=YAML_DUMPER)
     elif s3_file_format == S3FileFormat.JSON:
         return json.dumps(content)
     elif s3_file_format == S3FileFormat.MINIFIED_JSON:
@@ -11,6 +11,7 @@
 
 # pylint: disable=too-many-lines
 import abc
+from functools import lru_cache
 from hashlib import sha1, sha256
 from typing import List, Union
 
@@ -75,8 +76,14 @@ def create_hash_suffix(string_to_hash: str):
     )
 
 
+@lru_cache(maxsize=None)
 def get_user_data_content(user_data_path: str):
-    """Retrieve user data content."""
+    """
+    Retrieve user data content.
+
+    The content is read from the packaged resources once and then reused, since every queue and login nodes pool
+    of a cluster renders its launch template from the same file.
+    """
     user_data_file_path = pkg_resources.resource_filename(__name__, user_data_path)
     with open(user_data_file_path, "r", encoding="utf-8") as user_data_file:
         user_data_content = user_data_file.read()
@@ -61,6 +61,7 @@ class Pool(Construct):
         head_eni,
         cluster_bucket,
         cluster_hosted_zone,
+        subnets: Dict,
     ):
         super().__init__(scope, id)
         self._pool = pool
@@ -77,6 +78,7 @@ class Pool(Construct):
         self.stack_id = stack_id
         self._head_eni = head_eni
         self._cluster_hosted_zone = cluster_hosted_zone
+        self._subnets = subnets
         self._add_resources()
 
     def _add_resources(self):
@@ -433,10 +435,7 @@ class Pool(Construct):
             vpc=self._vpc,
             internet_facing=self._pool.networking.is_subnet_public,
             vpc_subnets=ec2.SubnetSelection(
-                subnets=[
-                    ec2.Subnet.from_subnet_id(self, f"LoginNodesSubnet{i}", subnet_id)
-                    for i, subnet_id in enumerate(self._pool.networking.subnet_ids)
-                ]
+                subnets=[self._subnets[subnet_id] for subnet_id in self._pool.networking.subnet_ids]
             ),
         )
         if is_feature_supported(Feature.NLB_SECURITY_GROUP):
@@ -524,6 +523,15 @@ class LoginNodesStack(NestedStack):
         return Stack.of(self.nested_stack_parent).stack_name
 
     def _add_resources(self):
+        # Subnets are imported once and shared, since different pools can be deployed in the same subnets
+        self._subnets = {}
+        for pool in self._login_nodes.pools:
+            for subnet_id in pool.networking.subnet_ids:
+                if subnet_id not in self._subnets:
+                    self._subnets[subnet_id] = ec2.Subnet.from_subnet_id(
+                        self, f"LoginNodesSubnet{len(self._subnets)}", subnet_id
+                    )
+
         self.pools = {}
         for pool in self._login_nodes.pools:
             pool_construct = Pool(
@@ -541,5 +549,6 @@ class LoginNodesStack(NestedStack):
                 self._head_eni,
                 self._cluster_bucket,
                 cluster_hosted_zone=self._cluster_hosted_zone,
+                subnets=self._subnets,
             )
             self.pools[pool.name] = pool_construct
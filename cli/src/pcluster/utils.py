@@ -23,8 +23,8 @@ import time
 import urllib
 import zipfile
 from concurrent.futures import ThreadPoolExecutor
-from io import BytesIO
 from shlex import quote
+from tempfile import SpooledTemporaryFile
 from typing import Callable, NoReturn
 from urllib.error import URLError
 from urllib.parse import urlparse
@@ -47,6 +47,9 @@ from pcluster.constants import (
 
 LOGGER = logging.getLogger(__name__)
 
+# Size above which zip archives created by zip_dir are spilled from memory to a temporary file
+ZIP_DIR_MAX_IN_MEMORY_SIZE = 8 * 1024 * 1024
+
 DEFAULT_PARTITION = "aws"
 PARTITION_MAP = {
     "cn-": "aws-cn",
@@ -143,11 +146,12 @@ def zip_dir(path):
     """
     Create a zip archive containing all files and dirs rooted in path.
 
-    The archive is created in memory and a file handler is returned by the function.
+    The archive is kept in memory up to 8 MiB and spilled to a temporary file beyond that size.
+    A file handler is returned by the function and should be closed by the caller.
     :param path: directory containing the resources to archive.
     :return: file handler pointing to the compressed archive.
     """
-    file_out = BytesIO()
+    file_out = SpooledTemporaryFile(max_size=ZIP_DIR_MAX_IN_MEMORY_SIZE)  # pylint: disable=consider-using-with
     with zipfile.ZipFile(file_out, "w", zipfile.ZIP_DEFLATED) as ziph:
         for root, _, files in os.walk(path):
             for file in files:
@@ -56,10 +56,8 @@ class InstanceTypeAcceleratorManufacturerValidator(Validator):
     def _validate(self, instance_type: str, instance_type_data: dict):
         gpu_info = instance_type_data.get("GpuInfo", {})
         if gpu_info:
-            gpu_manufacturers = list({gpu.get("Manufacturer", "") for gpu in gpu_info.get("Gpus", [])})
-
             # Only one GPU manufacturer is associated with each Instance Type's GPU
-            manufacturer = gpu_manufacturers[0] if gpu_manufacturers else ""
+            manufacturer = next((gpu.get("Manufacturer", "") for gpu in gpu_info.get("Gpus", [])), "")
             if manufacturer.upper() != "NVIDIA":
                 self._add_failure(
                     f"The accelerator manufacturer '{manufacturer}' for instance type '{instance_type}' is "
@@ -78,15 +76,14 @@ class InstanceTypeAcceleratorManufacturerValidator(Validator):
 
         inference_accelerator_info = instance_type_data.get("InferenceAcceleratorInfo", {})
         if inference_accelerator_info:
-            inference_accelerator_manufacturers = list(
-                {
+            # Only one accelerator manufacturer is associated with each Instance Type's accelerator
+            manufacturer = next(
+                (
                     accelerator.get("Manufacturer", "")
                     for accelerator in inference_accelerator_info.get("Accelerators", [])
-                }
+                ),
+                "",
             )
-
-            # Only one accelerator manufacturer is associated with each Instance Type's accelerator
-            manufacturer = inference_accelerator_manufacturers[0] if inference_accelerator_manufacturers else ""
             if manufacturer.upper() != "AWS":
                 self._add_failure(
                     f"The accelerator manufacturer '{manufacturer}' for instance type '{instance_type}' is "
@@ -112,7 +109,7 @@ class InstanceTypeValidator(Validator):
     """
 
     def _validate(self, instance_type: str):
-        if instance_type not in AWSApi.instance().ec2.list_instance_types():
+        if instance_type not in AWSApi.instance().ec2.get_instance_types_set():
             self._add_failure(f"The instance type '{instance_type}' is not supported.", FailureLevel.ERROR)
 
 
@@ -173,7 +170,7 @@ class InstanceTypeBaseAMICompatibleValidator(Validator):
             return None
 
     def _validate_instance_type(self, instance_type: str):
-        if instance_type not in AWSApi.instance().ec2.list_instance_types():
+        if instance_type not in AWSApi.instance().ec2.get_instance_types_set():
             self._add_failure(
                 f"The instance type '{instance_type}' is not supported.",
                 FailureLevel.ERROR,
@@ -417,8 +414,8 @@ def capacity_reservation_matches_instance(capacity_reservation: CapacityReservat
     return capacity_reservation.instance_type() == instance_type
 
 
-def capacity_reservation_matches_avail_zone(capacity_reservation: CapacityReservationInfo, subnet_id: str) -> bool:
-    return capacity_reservation.availability_zone() == AWSApi.instance().ec2.get_subnet_avail_zone(subnet_id)
+def capacity_reservation_matches_avail_zone(capacity_reservation: CapacityReservationInfo, avail_zone: str) -> bool:
+    return capacity_reservation.availability_zone() == avail_zone
 
 
 def capacity_reservation_resource_group_is_service_linked_group(capacity_reservation_resource_group_arn: str):
@@ -426,11 +423,8 @@ def capacity_reservation_resource_group_is_service_linked_group(capacity_reserva
         group_config = AWSApi.instance().resource_groups.get_group_configuration(
             group=capacity_reservation_resource_group_arn
         )
-        is_cr_pool = False
-        for config in group_config["GroupConfiguration"]["Configuration"]:
-            if "CapacityReservationPool" in config["Type"]:
-                is_cr_pool = True
-        return is_cr_pool
+        configurations = group_config["GroupConfiguration"]["Configuration"]
+        return any("CapacityReservationPool" in config["Type"] for config in configurations)
     except AWSClientError:
         return False
 
@@ -602,23 +596,28 @@ class PlacementGroupCapacityTypeValidator(Validator):
 class PlacementGroupCapacityReservationValidator(Validator):
     """Validate the placement group is compatible with the capacity reservation target."""
 
-    def _validate_chosen_pg(
-        self, subnet, instance_types, capacity_reservations: List[CapacityReservationInfo], chosen_pg
-    ):
+    @staticmethod
+    def _get_placement_groups_per_instance_type(
+        capacity_reservations: List[CapacityReservationInfo], subnet_az: str
+    ) -> Dict[str, List[str]]:
+        """Map instance types to the placement group names of the capacity reservations in the subnet AZ."""
+        placement_groups_per_instance_type = defaultdict(list)
+        for capacity_reservation in capacity_reservations:
+            if capacity_reservation_matches_avail_zone(capacity_reservation=capacity_reservation, avail_zone=subnet_az):
+                placement_groups_per_instance_type[capacity_reservation.instance_type()].append(
+                    get_resource_name_from_resource_arn(capacity_reservation.placement_group_arn())
+                )
+        return placement_groups_per_instance_type
+
+    def _validate_chosen_pg(self, instance_types, placement_groups_per_instance_type, chosen_pg):
         pg_match, open_or_targeted = False, False
         for instance_type in instance_types:
-            for capacity_reservation in capacity_reservations:
-                if capacity_reservation_matches_instance(
-                    capacity_reservation=capacity_reservation, instance_type=instance_type
-                ) and capacity_reservation_matches_avail_zone(
-                    capacity_reservation=capacity_reservation, subnet_id=subnet
-                ):
-                    odcr_pg = get_resource_name_from_resource_arn(capacity_reservation.placement_group_arn())
-                    if odcr_pg:
-                        if odcr_pg == chosen_pg:
-                            pg_match = True
-                    else:
-                        open_or_targeted = True
+            for odcr_pg in placement_groups_per_instance_type.get(instance_type, []):
+                if odcr_pg:
+                    if odcr_pg == chosen_pg:
+                        pg_match = True
+                else:
+                    open_or_targeted = True
             if not (pg_match or open_or_targeted):
                 self._add_failure(
                     f"The placement group provided '{chosen_pg}' targets the '{instance_type}' instance type but there "
@@ -635,23 +634,10 @@ class PlacementGroupCapacityReservationValidator(Validator):
                     FailureLevel.WARNING,
                 )
 
-    def _validate_no_pg(
-        self, instance_types, capacity_reservations: List[CapacityReservationInfo], subnet, subnet_id_az_mapping
-    ):
+    def _validate_no_pg(self, instance_types, placement_groups_per_instance_type, subnet, subnet_id_az_mapping):
         for instance_type in instance_types:
-            odcr_without_pg = False
-            for capacity_reservation in capacity_reservations:
-                odcr_pg = get_resource_name_from_resource_arn(capacity_reservation.placement_group_arn())
-                # search for a capacity reservation without a placement group and matching instance type and avail zone
-                if not odcr_pg and (
-                    capacity_reservation_matches_instance(
-                        capacity_reservation=capacity_reservation, instance_type=instance_type
-                    )
-                    and capacity_reservation_matches_avail_zone(
-                        capacity_reservation=capacity_reservation, subnet_id=subnet
-                    )
-                ):
-                    odcr_without_pg = True
+            # search for a capacity reservation without a placement group and matching instance type and avail zone
+            odcr_without_pg = any(not odcr_pg for odcr_pg in placement_groups_per_instance_type.get(instance_type, []))
             if not odcr_without_pg:
                 self._add_failure(
                     f"There are no open or targeted ODCRs that match the instance_type '{instance_type}' in "
@@ -672,17 +658,21 @@ class PlacementGroupCapacityReservationValidator(Validator):
             else:
                 capacity_reservations = None
             if capacity_reservations:
+                # Resolve the subnet availability zone and parse the placement group ARNs once per reservation,
+                # instead of once per instance type and reservation
+                placement_groups_per_instance_type = self._get_placement_groups_per_instance_type(
+                    capacity_reservations, AWSApi.instance().ec2.get_subnet_avail_zone(subnet)
+                )
                 if placement_group:
                     self._validate_chosen_pg(
-                        subnet=subnet,
                         instance_types=instance_types,
-                        capacity_reservations=capacity_reservations,
+                        placement_groups_per_instance_type=placement_groups_per_instance_type,
                         chosen_pg=placement_group,
                     )
                 else:
                     self._validate_no_pg(
                         subnet=subnet,
                         instance_types=instance_types,
-                        capacity_reservations=capacity_reservations,
+                        placement_groups_per_instance_type=placement_groups_per_instance_type,
                         subnet_id_az_mapping=subnet_id_az_mapping,
                     )
@@ -21,11 +21,16 @@ class SecurityGroupsValidator(Validator):
 
     def _validate(self, security_group_ids: List[str]):
         if security_group_ids:
-            for sg_id in security_group_ids:
-                try:
-                    AWSApi.instance().ec2.describe_security_group(sg_id)
-                except AWSClientError as e:
-                    self._add_failure(str(e), FailureLevel.ERROR)
+            try:
+                # Describe all the security groups with a single call, it fails if any of them does not exist
+                AWSApi.instance().ec2.describe_security_groups(security_group_ids)
+            except AWSClientError:
+                # Describe the security groups one by one to report a failure for each invalid one
+                for sg_id in security_group_ids:
+                    try:
+                        AWSApi.instance().ec2.describe_security_group(sg_id)
+                    except AWSClientError as e:
+                        self._add_failure(str(e), FailureLevel.ERROR)
 
 
 class SubnetsValidator(Validator):
@@ -39,20 +44,26 @@ class SubnetsValidator(Validator):
 
     def _validate(self, subnet_ids: List[str]):
         try:
-            subnets = AWSApi.instance().ec2.describe_subnets(subnet_ids=subnet_ids)
+            # The head node subnet is usually also a compute subnet, describe each subnet only once
+            subnets = AWSApi.instance().ec2.describe_subnets(subnet_ids=list(dict.fromkeys(subnet_ids)))
 
             # Check all subnets are in the same VPC
             vpc_id = None
+            single_vpc = True
             for subnet in subnets:
                 if vpc_id is None:
                     vpc_id = subnet["VpcId"]
                 elif vpc_id != subnet["VpcId"]:
+                    single_vpc = False
                     self._add_failure(
                         "Subnet {0} is not in VPC {1}. Please make sure all subnets are in the same VPC.".format(
                             subnet["SubnetId"], vpc_id
                         ),
                         FailureLevel.ERROR,
                     )
+            if not single_vpc:
+                # The VPC is ambiguous, skip the DNS checks until the subnets are fixed
+                return
 
             # Check for DNS support in the VPC
             if not AWSApi.instance().ec2.is_enable_dns_support(vpc_id):
@@ -161,13 +172,15 @@ class LambdaFunctionsVpcConfigValidator(Validator):
         existing_security_groups = AWSApi.instance().ec2.describe_security_groups(security_group_ids)
         existing_subnets = AWSApi.instance().ec2.describe_subnets(subnet_ids)
 
-        self._validate_all_security_groups_exist(existing_security_groups, security_group_ids)
-        self._validate_all_subnets_exist(existing_subnets, subnet_ids)
-        self._validate_all_resources_belong_to_the_same_vpc(existing_security_groups, existing_subnets)
+        # Map the ids to their VPC with a single pass over each response
+        group_vpc_ids = {group["GroupId"]: group["VpcId"] for group in existing_security_groups}
+        subnet_vpc_ids = {subnet["SubnetId"]: subnet["VpcId"] for subnet in existing_subnets}
+
+        self._validate_all_security_groups_exist(group_vpc_ids.keys(), security_group_ids)
+        self._validate_all_subnets_exist(subnet_vpc_ids.keys(), subnet_ids)
+        self._validate_all_resources_belong_to_the_same_vpc(set(group_vpc_ids.values()), set(subnet_vpc_ids.values()))
 
-    def _validate_all_resources_belong_to_the_same_vpc(self, existing_security_groups, existing_subnets):
-        group_vpc_ids = {group["VpcId"] for group in existing_security_groups}
-        subnet_vpc_ids = {subnet["VpcId"] for subnet in existing_subnets}
+    def _validate_all_resources_belong_to_the_same_vpc(self, group_vpc_ids, subnet_vpc_ids):
         if len(group_vpc_ids) > 1:
             self._add_failure(
                 "The security groups associated to the Lambda are required to be in the same VPC.", FailureLevel.ERROR
@@ -176,16 +189,15 @@ class LambdaFunctionsVpcConfigValidator(Validator):
             self._add_failure(
                 "The subnets associated to the Lambda are required to be in the same VPC.", FailureLevel.ERROR
             )
-        if group_vpc_ids != subnet_vpc_ids:
+        # Only compare the VPCs when both sides are consistent, otherwise the failures above already cover the mismatch
+        if len(group_vpc_ids) == 1 and len(subnet_vpc_ids) == 1 and group_vpc_ids != subnet_vpc_ids:
             self._add_failure(
                 "The security groups and subnets associated to the Lambda are required to be in the same VPC.",
                 FailureLevel.ERROR,
             )
 
-    def _validate_all_security_groups_exist(self, existing_security_groups, expected_security_group_ids):
-        missing_security_group_ids = set(expected_security_group_ids) - {
-            group["GroupId"] for group in existing_security_groups
-        }
+    def _validate_all_security_groups_exist(self, existing_security_group_ids, expected_security_group_ids):
+        missing_security_group_ids = set(expected_security_group_ids) - existing_security_group_ids
         if missing_security_group_ids:
             self._add_failure(
                 "Some security groups associated to the Lambda are not present "
@@ -193,8 +205,8 @@ class LambdaFunctionsVpcConfigValidator(Validator):
                 FailureLevel.ERROR,
             )
 
-    def _validate_all_subnets_exist(self, existing_subnets, expected_subnet_ids):
-        missing_subnet_ids = set(expected_subnet_ids) - {subnet["SubnetId"] for subnet in existing_subnets}
+    def _validate_all_subnets_exist(self, existing_subnet_ids, expected_subnet_ids):
+        missing_subnet_ids = set(expected_subnet_ids) - existing_subnet_ids
         if missing_subnet_ids:
             self._add_failure(
                 f"Some subnets associated to the Lambda are not present in the account: {sorted(missing_subnet_ids)}.",
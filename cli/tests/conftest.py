@@ -4,6 +4,7 @@ This module loads pytest fixtures and plugins needed by all tests.
 It's very useful for fixtures that need to be shared among all tests.
 """
 
+import functools
 import logging
 import os
 import sys
@@ -40,6 +41,14 @@ def reset_aws_api():
     AWSApi._instance = None
 
 
+@pytest.fixture(autouse=True)
+def reset_s3_bucket_factory():
+    """Reset the bootstrapped buckets remembered by S3BucketFactory to remove dependencies between tests."""
+    from pcluster.models.s3_bucket import S3BucketFactory
+
+    S3BucketFactory.reset()
+
+
 @pytest.fixture
 def failed_with_message(capsys):
     """Assert that the command exited with a specific error message."""
@@ -73,6 +82,16 @@ def test_datadir(request, datadir):
     return datadir / "{0}/{1}".format(class_name, function_name)
 
 
+@functools.lru_cache(maxsize=None)
+def _get_boto3_client(service, region):
+    """
+    Create a boto3 client once per service and region and share it across tests.
+
+    Building a boto3 client is expensive, while stubbers are cheap to attach to and remove from an existing client.
+    """
+    return boto3.client(service, region_name=region)
+
+
 @pytest.fixture()
 def boto3_stubber(mocker, boto3_stubber_path):
     """
@@ -101,7 +120,9 @@ def boto3_stubber(mocker, boto3_stubber_path):
             # We need to provide a region to boto3 to avoid no region exception.
             # Which region to provide is arbitrary.
             os.environ["AWS_DEFAULT_REGION"] = "us-east-1"
-        client = boto3.client(service)
+        region = os.environ["AWS_DEFAULT_REGION"]
+        # The shared client may already be stubbed by this test, in that case create a dedicated one.
+        client = boto3.client(service) if service in mocked_clients else _get_boto3_client(service, region)
         stubber = Stubber(client)
         # Save a ref to the stubber so that we can deactivate it at the end of the test.
         created_stubbers.append(stubber)
@@ -132,10 +153,12 @@ def boto3_stubber(mocker, boto3_stubber_path):
     # Used for resources cleanup.
     yield _boto3_stubber
 
-    # Assert that all mocked requests were consumed and deactivate all stubbers.
+    # Deactivate all stubbers, so that shared clients are left clean even if the assertions below fail.
     for stubber in created_stubbers:
-        stubber.assert_no_pending_responses()
         stubber.deactivate()
+    # Assert that all mocked requests were consumed.
+    for stubber in created_stubbers:
+        stubber.assert_no_pending_responses()
 
 
 @pytest.fixture()
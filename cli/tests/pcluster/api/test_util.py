@@ -12,6 +12,7 @@ import pytest
 from assertpy import assert_that
 
 from pcluster.api import util
+from pcluster.api.models import UpdateClusterRequestContent
 
 
 class TestParallelClusterApiUtil:
@@ -74,3 +75,17 @@ class TestParallelClusterApiUtil:
         warnings = [record for record in caplog.records if record.levelno == logging.CRITICAL]
         assert_that(warnings).is_length(1)
         assert_that(warnings[0].message).starts_with(expected_message)
+
+    @pytest.mark.parametrize(
+        "data, expected_cluster_configuration",
+        [
+            ({"clusterConfiguration": "Image:\n  Os: alinux2"}, "Image:\n  Os: alinux2"),
+            ({"unknownKey": "value"}, None),
+            ("not-a-dict", None),
+            (None, None),
+        ],
+    )
+    def test_deserialize_model(self, data, expected_cluster_configuration):
+        model = util.deserialize_model(data, UpdateClusterRequestContent)
+        assert_that(model).is_instance_of(UpdateClusterRequestContent)
+        assert_that(model.cluster_configuration).is_equal_to(expected_cluster_configuration)
@@ -8,6 +8,7 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import functools
 import ipaddress
 import os
 from datetime import datetime
@@ -94,38 +95,48 @@ class _DummyInstanceTypeInfo(InstanceTypeInfo):
         return True if self._instance_type.startswith("c5d") else False
 
 
+@functools.lru_cache(maxsize=None)
+def _get_dummy_instance_type_info(instance_type):
+    """Return the dummy info of the instance type, built once per type like Ec2Client.get_instance_type_info."""
+    return _DummyInstanceTypeInfo(instance_type)
+
+
 class _DummyAWSApi(AWSApi):
     def __init__(self):
+        """Override Parent constructor. Dummy clients are created on first access, see __getattr__."""
         os.environ["AWS_DEFAULT_REGION"] = "us-east-1"
-        self._ec2 = _DummyEc2Client()
-        self._efs = _DummyEfsClient()
-        self._fsx = _DummyFSxClient()
-        self._cfn = _DummyCfnClient()
-        self._s3 = _DummyS3Client()
-        self._imagebuilder = _DummyImageBuilderClient()
-        self._kms = _DummyKmsClient()
-        self._sts = _DummyStsClient()
-        self._s3_resource = _DummyS3Resource()
-        self._iam = _DummyIamClient()
-        self._batch = _DummyBatchClient()
-        self._logs = _DummyLogsClient()
-        self._ddb_resource = _DummyDynamoResource()
-        self._route53 = _DummyRoute53Client()
-        self._resource_groups = _DummyResourceGroupsClient()
-        self._secretsmanager = _DummySecretsManagerClient()
-        self._ssm = _DummySsmClient()
-
-
-class _DummyCfnClient(CfnClient):
+
+    def __getattr__(self, name):
+        """Create the dummy client backing an AWSApi property the first time it is accessed."""
+        client_class = _DUMMY_CLIENTS.get(name)
+        if client_class is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        client = client_class()
+        setattr(self, name, client)
+        return client
+
+
+class _NoBotoInit:
     def __init__(self):
         """Override Parent constructor. No real boto3 client is created."""
         pass
 
+
+class _DummyCfnClient(_NoBotoInit, CfnClient):
     def describe_stack_resources(self, stack_name: str):
         return {}
 
 
 class _DummyEc2Client(Ec2Client):
+    _SUBNETS = (
+        {
+            "AvailabilityZone": "string",
+            "AvailabilityZoneId": "string",
+            "SubnetId": "subnet-123",
+            "VpcId": "vpc-123",
+        },
+    )
+
     def __init__(self):
         """Override Parent constructor. No real boto3 client is created."""
         self.capacity_reservations_cache = {
@@ -140,14 +151,7 @@ class _DummyEc2Client(Ec2Client):
         return "dummy-ami-id"
 
     def describe_subnets(self, subnet_ids):
-        return [
-            {
-                "AvailabilityZone": "string",
-                "AvailabilityZoneId": "string",
-                "SubnetId": "subnet-123",
-                "VpcId": "vpc-123",
-            },
-        ]
+        return self._SUBNETS
 
     def describe_volume(self, volume_id):
         return {
@@ -194,25 +198,16 @@ class _DummyEc2Client(Ec2Client):
             return super().get_subnet_cidr(subnet)
 
 
-class _DummyEfsClient(EfsClient):
-    def __init__(self):
-        """Override Parent constructor. No real boto3 client is created."""
-        pass
-
-    def get_efs_mount_target_id(self, efs_fs_id, avail_zone):
-        mt_id = None
-        efs_ids_mount_targets = {
-            "dummy-efs-1": {
-                "dummy-az-1": "dummy-efs-mt-1",
-                "dummy-az-2": "dummy-efs-mt-2",
-            }
+class _DummyEfsClient(_NoBotoInit, EfsClient):
+    _MOUNT_TARGETS = {
+        "dummy-efs-1": {
+            "dummy-az-1": "dummy-efs-mt-1",
+            "dummy-az-2": "dummy-efs-mt-2",
         }
+    }
 
-        mt_dict = efs_ids_mount_targets.get(efs_fs_id)
-        if mt_dict:
-            mt_id = mt_dict.get(avail_zone)
-
-        return mt_id
+    def get_efs_mount_target_id(self, efs_fs_id, avail_zone):
+        return self._MOUNT_TARGETS.get(efs_fs_id, {}).get(avail_zone)
 
     def get_efs_mount_target_security_groups(self, target_id):
         return ["sg-12345678", "sg-23456789"]
@@ -291,41 +286,27 @@ class _DummyFSxClient(FSxClient):
         return result
 
 
-class _DummyS3Client(S3Client):
-    def __init__(self):
-        """Override Parent constructor. No real boto3 client is created."""
-        pass
+class _DummyS3Client(_NoBotoInit, S3Client):
+    pass
 
 
-class _DummyImageBuilderClient(ImageBuilderClient):
-    def __init__(self):
-        """Override Parent constructor. No real boto3 client is created."""
-        pass
-
+class _DummyImageBuilderClient(_NoBotoInit, ImageBuilderClient):
+    pass
 
-class _DummyKmsClient(KmsClient):
-    def __init__(self):
-        """Override Parent constructor. No real boto3 client is created."""
-        pass
 
+class _DummyKmsClient(_NoBotoInit, KmsClient):
+    pass
 
-class _DummyStsClient(StsClient):
-    def __init__(self):
-        """Override Parent constructor. No real boto3 client is created."""
-        pass
 
+class _DummyStsClient(_NoBotoInit, StsClient):
+    pass
 
-class _DummyS3Resource(S3Resource):
-    def __init__(self):
-        """Override Parent constructor. No real boto3 client is created."""
-        pass
 
+class _DummyS3Resource(_NoBotoInit, S3Resource):
+    pass
 
-class _DummyIamClient(IamClient):
-    def __init__(self):
-        """Override Parent constructor. No real boto3 client is created."""
-        pass
 
+class _DummyIamClient(_NoBotoInit, IamClient):
     def get_instance_profile(self, instance_profile_name):
         return {
             "InstanceProfile": {
@@ -348,35 +329,23 @@ class _DummyIamClient(IamClient):
         }
 
 
-class _DummyDynamoResource(DynamoResource):
-    def __init__(self):
-        """Override Parent constructor. No real boto3 client is created."""
-        pass
+class _DummyDynamoResource(_NoBotoInit, DynamoResource):
+    pass
 
 
-class _DummyBatchClient(IamClient):
-    def __init__(self):
-        """Override Parent constructor. No real boto3 client is created."""
-        pass
+class _DummyBatchClient(_NoBotoInit, IamClient):
+    pass
 
 
-class _DummyLogsClient(LogsClient):
-    def __init__(self):
-        """Override Parent constructor. No real boto3 client is created."""
-        pass
+class _DummyLogsClient(_NoBotoInit, LogsClient):
+    pass
 
 
-class _DummyRoute53Client(Route53Client):
-    def __init__(self):
-        """Override Parent constructor. No real boto3 client is created."""
-        pass
+class _DummyRoute53Client(_NoBotoInit, Route53Client):
+    pass
 
 
-class _DummyResourceGroupsClient(ResourceGroupsClient):
-    def __init__(self):
-        """Override Parent constructor. No real boto3 client is created."""
-        pass
-
+class _DummyResourceGroupsClient(_NoBotoInit, ResourceGroupsClient):
     def get_capacity_reservation_ids_from_group_resources(self, group):
         """Return a list of capacity reservation ids."""
         return (
@@ -423,12 +392,34 @@ class _DummySsmClient(SsmClient):
         }
 
 
+_DUMMY_CLIENTS = {
+    "_ec2": _DummyEc2Client,
+    "_efs": _DummyEfsClient,
+    "_fsx": _DummyFSxClient,
+    "_cfn": _DummyCfnClient,
+    "_s3": _DummyS3Client,
+    "_imagebuilder": _DummyImageBuilderClient,
+    "_kms": _DummyKmsClient,
+    "_sts": _DummyStsClient,
+    "_s3_resource": _DummyS3Resource,
+    "_iam": _DummyIamClient,
+    "_batch": _DummyBatchClient,
+    "_logs": _DummyLogsClient,
+    "_ddb_resource": _DummyDynamoResource,
+    "_route53": _DummyRoute53Client,
+    "_resource_groups": _DummyResourceGroupsClient,
+    "_secretsmanager": _DummySecretsManagerClient,
+    "_ssm": _DummySsmClient,
+}
+
+
 def mock_aws_api(mocker, mock_instance_type_info=True):
     """Mock AWS Api."""
-    mocker.patch("pcluster.aws.aws_api.AWSApi.instance", return_value=_DummyAWSApi())
-    mocker.patch(
-        "pcluster.aws.ec2.Ec2Client.describe_image",
+    mocker.patch.object(AWSApi, "instance", return_value=_DummyAWSApi())
+    mocker.patch.object(
+        Ec2Client,
+        "describe_image",
         return_value=ImageInfo({"BlockDeviceMappings": [{"DeviceName": "/dev/sda1", "Ebs": {"VolumeSize": 35}}]}),
     )
     if mock_instance_type_info:
-        mocker.patch("pcluster.aws.ec2.Ec2Client.get_instance_type_info", side_effect=_DummyInstanceTypeInfo)
+        mocker.patch.object(Ec2Client, "get_instance_type_info", side_effect=_get_dummy_instance_type_info)
@@ -91,6 +91,19 @@ def test_list_instance_types(boto3_stubber, generate_error):
         assert_that(return_value).is_equal_to(dummy_instance_types)
 
 
+def test_get_instance_types_set(mocker):
+    mock_aws_api(mocker)
+    list_instance_types_mock = mocker.patch(
+        "pcluster.aws.ec2.Ec2Client.list_instance_types", return_value=["c5.xlarge", "m6g.xlarge", "c5.xlarge"]
+    )
+    ec2_client = Ec2Client()
+
+    for _ in range(2):
+        assert_that(ec2_client.get_instance_types_set()).is_equal_to(frozenset({"c5.xlarge", "m6g.xlarge"}))
+
+    list_instance_types_mock.assert_called_once()
+
+
 @pytest.mark.parametrize(
     "instance_type, supported_architectures, error_message",
     [
@@ -509,15 +522,43 @@ def test_describe_subnets_cache(boto3_stubber):
 def test_get_subnet_ids_az_mapping(boto3_stubber):
     subnet_ids = ["subnet-123", "subnet-456"]
     avail_zones = {"subnet-123": "us-east-1a", "subnet-456": "us-east-1b"}
-    mocked_requests = [
-        get_describe_subnets_mocked_request([subnet_id], "available", avail_zones) for subnet_id in subnet_ids
-    ]
+    # A single DescribeSubnets call is expected, even if a subnet is repeated
+    mocked_requests = [get_describe_subnets_mocked_request(subnet_ids, "available", avail_zones)]
     boto3_stubber("ec2", mocked_requests)
-    response = AWSApi.instance().ec2.get_subnets_az_mapping(subnet_ids)
+    response = AWSApi.instance().ec2.get_subnets_az_mapping(subnet_ids + ["subnet-123"])
     assert_that(response["subnet-123"]).is_equal_to("us-east-1a")
     assert_that(response["subnet-456"]).is_equal_to("us-east-1b")
 
 
+def test_is_enable_dns_support_cache(boto3_stubber):
+    vpc_id = "vpc-123"
+    mocked_requests = [
+        MockedBoto3Request(
+            method="describe_vpc_attribute",
+            response={"VpcId": vpc_id, "EnableDnsSupport": {"Value": True}},
+            expected_params={"VpcId": vpc_id, "Attribute": "enableDnsSupport"},
+        )
+    ]
+    boto3_stubber("ec2", mocked_requests)
+    # The second call is served by the cache, a further boto3 call would fail since no other request is stubbed
+    for _ in range(2):
+        assert_that(AWSApi.instance().ec2.is_enable_dns_support(vpc_id)).is_true()
+
+
+def test_describe_placement_group_cache(boto3_stubber):
+    group_name = "my-placement-group"
+    response = {"PlacementGroups": [{"GroupName": group_name, "State": "available", "Strategy": "cluster"}]}
+    mocked_requests = [
+        MockedBoto3Request(
+            method="describe_placement_groups", response=response, expected_params={"GroupNames": [group_name]}
+        )
+    ]
+    boto3_stubber("ec2", mocked_requests)
+    # The second call is served by the cache, a further boto3 call would fail since no other request is stubbed
+    for _ in range(2):
+        assert_that(AWSApi.instance().ec2.describe_placement_group(group_name)).is_equal_to(response)
+
+
 def get_describe_capacity_reservation_mocked_request(capacity_reservations, state):
     return MockedBoto3Request(
         method="describe_capacity_reservations",
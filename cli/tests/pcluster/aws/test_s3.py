@@ -0,0 +1,108 @@
+# Copyright 2021 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+from assertpy import assert_that
+
+from pcluster.aws.common import AWSClientError
+from pcluster.aws.s3 import S3Client
+from tests.utils import MockedBoto3Request
+
+BUCKET_NAME = "parallelcluster-a69601b5ee1fc2f2-v1-do-not-delete"
+PREFIX = "parallelcluster/clusters/dummy-cluster-randomstring123/"
+
+
+@pytest.fixture()
+def boto3_stubber_path():
+    return "pcluster.aws.common.boto3"
+
+
+def _versions(start, count):
+    return [
+        {"Key": f"{PREFIX}object-{index}", "VersionId": f"version-{index}"} for index in range(start, start + count)
+    ]
+
+
+@pytest.mark.parametrize(
+    "pages, expected_batch_sizes",
+    [
+        pytest.param([{}], [], id="nothing to delete"),
+        pytest.param([{"Versions": _versions(0, 3)}], [3], id="single page"),
+        pytest.param(
+            [{"Versions": _versions(0, 2), "DeleteMarkers": _versions(2, 1)}], [3], id="versions and delete markers"
+        ),
+        pytest.param(
+            [{"Versions": _versions(0, 600)}, {"Versions": _versions(600, 401)}],
+            [1000, 1],
+            id="batches capped at 1000 keys across pages",
+        ),
+    ],
+)
+def test_delete_object_versions(boto3_stubber, pages, expected_batch_sizes):
+    all_versions = [version for page in pages for version in page.get("Versions", []) + page.get("DeleteMarkers", [])]
+    mocked_requests = []
+    for index, page in enumerate(pages):
+        response = dict(page)
+        expected_params = {"Bucket": BUCKET_NAME, "Prefix": PREFIX}
+        if index > 0:
+            expected_params["KeyMarker"] = f"marker-{index}"
+        if index < len(pages) - 1:
+            response.update({"IsTruncated": True, "NextKeyMarker": f"marker-{index + 1}"})
+        mocked_requests.append(
+            MockedBoto3Request(method="list_object_versions", response=response, expected_params=expected_params)
+        )
+    offset = 0
+    for batch_size in expected_batch_sizes:
+        mocked_requests.append(
+            MockedBoto3Request(
+                method="delete_objects",
+                response={},
+                expected_params={
+                    "Bucket": BUCKET_NAME,
+                    "Delete": {"Objects": all_versions[offset : offset + batch_size], "Quiet": True},  # noqa: E203
+                },
+            )
+        )
+        offset += batch_size
+    boto3_stubber("s3", mocked_requests)
+
+    S3Client().delete_object_versions(bucket_name=BUCKET_NAME, prefix=PREFIX)
+
+
+def test_delete_object_versions_with_errors(boto3_stubber):
+    versions = _versions(0, 2)
+    mocked_requests = [
+        MockedBoto3Request(
+            method="list_object_versions",
+            response={"Versions": versions},
+            expected_params={"Bucket": BUCKET_NAME, "Prefix": PREFIX},
+        ),
+        MockedBoto3Request(
+            method="delete_objects",
+            response={
+                "Errors": [
+                    {
+                        "Key": versions[1]["Key"],
+                        "VersionId": versions[1]["VersionId"],
+                        "Code": "AccessDenied",
+                        "Message": "Access Denied",
+                    }
+                ]
+            },
+            expected_params={"Bucket": BUCKET_NAME, "Delete": {"Objects": versions, "Quiet": True}},
+        ),
+    ]
+    boto3_stubber("s3", mocked_requests)
+
+    with pytest.raises(AWSClientError) as error:
+        S3Client().delete_object_versions(bucket_name=BUCKET_NAME, prefix=PREFIX)
+    assert_that(error.value.error_code).is_equal_to("AccessDenied")
+    assert_that(str(error.value)).contains(f"Failed to delete 1 object(s) under {BUCKET_NAME}/{PREFIX}")
+    assert_that(str(error.value)).contains(f"{versions[1]['Key']} (Access Denied)")
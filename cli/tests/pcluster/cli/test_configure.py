@@ -6,6 +6,7 @@
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from pcluster.cli.commands.configure import easyconfig
 from pcluster.cli.entrypoint import run
 
 
@@ -20,5 +21,5 @@ class TestConfigureCommand:
         )
 
     def test_execute(self, mocker):
-        mocker.patch("pcluster.cli.commands.configure.easyconfig.configure", return_value=True)
+        mocker.patch.object(easyconfig, "configure", return_value=True)
         run(["configure", "--config", "./test/config"])
@@ -8,6 +8,8 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import hashlib
+import io
 import json
 import os
 import textwrap
@@ -17,10 +19,22 @@ import pytest
 from assertpy import assert_that
 
 from pcluster.aws.common import AWSClientError
-from pcluster.models.s3_bucket import S3Bucket, S3FileFormat, S3FileType, format_content
+from pcluster.models.s3_bucket import (
+    S3Bucket,
+    S3BucketFactory,
+    S3FileFormat,
+    S3FileType,
+    _get_bucket_name,
+    format_content,
+)
 from pcluster.utils import format_arn, get_service_principal
 from tests.pcluster.aws.dummy_aws_api import mock_aws_api
-from tests.pcluster.models.dummy_s3_bucket import dummy_cluster_bucket, mock_bucket, mock_bucket_utils
+from tests.pcluster.models.dummy_s3_bucket import (
+    dummy_cluster_bucket,
+    mock_bucket,
+    mock_bucket_object_utils,
+    mock_bucket_utils,
+)
 
 
 @pytest.mark.parametrize(
@@ -67,11 +81,47 @@ def test_configure_s3_bucket(mocker, put_bucket_versioning_error, put_bucket_enc
 
     mocker.patch("pcluster.aws.s3.S3Client.put_bucket_versioning", side_effect=put_bucket_versioning_error)
     mocker.patch("pcluster.aws.s3.S3Client.put_bucket_encryption", side_effect=put_bucket_encryption_error)
-    mocker.patch("pcluster.aws.s3.S3Client.put_bucket_policy", side_effect=put_bucket_policy_error)
+    put_bucket_policy_mock = mocker.patch(
+        "pcluster.aws.s3.S3Client.put_bucket_policy", side_effect=put_bucket_policy_error
+    )
 
     if put_bucket_versioning_error or put_bucket_encryption_error or put_bucket_policy_error:
         with pytest.raises(AWSClientError, match="An error occurred"):
             bucket.configure_s3_bucket()
+    else:
+        bucket.configure_s3_bucket()
+        policy = put_bucket_policy_mock.call_args.kwargs["policy"]
+        assert_that(policy).does_not_contain(" ", "\n")
+        assert_that(json.loads(policy)).is_equal_to(bucket._generate_bucket_policy())
+
+
+@pytest.mark.parametrize(
+    "cleanup_on_deletion, delete_error, expected_calls",
+    [
+        (True, None, 1),
+        (True, AWSClientError("delete_object_versions", "An error occurred"), 1),
+        (False, None, 0),
+    ],
+)
+def test_delete_s3_artifacts(mocker, caplog, cleanup_on_deletion, delete_error, expected_calls):
+    mock_aws_api(mocker)
+    mock_bucket(mocker)
+    bucket = S3Bucket(
+        service_name="test-service",
+        stack_name="test-stack",
+        artifact_directory="test-artifact-directory",
+        cleanup_on_deletion=cleanup_on_deletion,
+        name="test-bucket",
+    )
+    delete_mock = mocker.patch("pcluster.aws.s3.S3Client.delete_object_versions", side_effect=delete_error)
+
+    bucket.delete_s3_artifacts()
+
+    assert_that(delete_mock.call_count).is_equal_to(expected_calls)
+    if expected_calls:
+        delete_mock.assert_called_with(bucket_name="test-bucket", prefix="test-artifact-directory/")
+    if delete_error:
+        assert_that(caplog.text).contains("Failed to delete S3 artifact under test-bucket/test-artifact-directory")
 
 
 @pytest.mark.parametrize(
@@ -275,6 +325,33 @@ def test_format_content(content, s3_file_format, expected_output):
     assert_that(formatted_content).is_type_of(type(expected_output))
 
 
+@pytest.mark.parametrize(
+    "file_content, s3_file_format, expected_file",
+    [
+        ("A:\n  A1: X\nB:\n- B1\n", S3FileFormat.YAML, {"A": {"A1": "X"}, "B": ["B1"]}),
+        ('{"A": {"A1": "X"}, "B": ["B1"]}', S3FileFormat.JSON, {"A": {"A1": "X"}, "B": ["B1"]}),
+        ("A:\n  A1: X\n", S3FileFormat.TEXT, "A:\n  A1: X\n"),
+    ],
+)
+def test_get_file(mocker, file_content, s3_file_format, expected_file):
+    mock_aws_api(mocker)
+    mock_bucket(mocker)
+    bucket = dummy_cluster_bucket(bucket_name="test-bucket", artifact_directory="pcluster_artifact_directory")
+    body = io.BytesIO(file_content.encode("utf-8"))
+    get_object_mock = mocker.patch(
+        "pcluster.aws.s3.S3Client.get_object",
+        return_value={"Body": body},
+    )
+
+    file = bucket.get_cfn_template("test_template_name", format=s3_file_format)
+
+    assert_that(file).is_equal_to(expected_file)
+    assert_that(body.closed).is_true()
+    get_object_mock.assert_called_with(
+        bucket_name="test-bucket", key="pcluster_artifact_directory/templates/test_template_name", version_id=None
+    )
+
+
 @pytest.mark.parametrize(
     "content, file_name, file_type, s3_file_format, expected_object_key, expected_object_body",
     [
@@ -544,3 +621,121 @@ def test_check_bucket_is_bootstrapped(
     else:
         result = bucket.check_bucket_is_bootstrapped()
         assert_that(result).is_equal_to(expected_result)
+
+
+@pytest.mark.parametrize("is_bootstrapped", [True, False])
+def test_init_s3_bucket_checks_bootstrap_once(mocker, is_bootstrapped):
+    mock_aws_api(mocker)
+    mock_bucket(mocker)
+    bucket_utils_mocks = mock_bucket_utils(mocker)
+    bucket_object_utils_mocks = mock_bucket_object_utils(
+        mocker, check_bucket_is_bootstrapped_return_value=is_bootstrapped
+    )
+
+    for _ in range(2):
+        bucket = S3BucketFactory.init_s3_bucket(
+            service_name="dummy-cluster",
+            artifact_directory="parallelcluster/clusters/dummy-cluster-randomstring123",
+            stack_name="parallelcluster-dummy-cluster",
+            custom_s3_bucket=None,
+        )
+        assert_that(bucket.name).is_equal_to("parallelcluster-a69601b5ee1fc2f2-v1-do-not-delete")
+
+    assert_that(bucket_utils_mocks["check_bucket_exists"].call_count).is_equal_to(2)
+    assert_that(bucket_object_utils_mocks["check_bucket_is_bootstrapped"].call_count).is_equal_to(1)
+    assert_that(bucket_utils_mocks["configure_s3_bucket"].call_count).is_equal_to(0 if is_bootstrapped else 1)
+
+
+def test_get_bucket_name():
+    expected_bucket_name = "parallelcluster-89e4e5f1cd12e98b-v1-do-not-delete"
+    assert_that(S3Bucket.generate_s3_bucket_hash_suffix("123456789012", "us-east-1")).is_equal_to("89e4e5f1cd12e98b")
+    assert_that(S3Bucket.get_bucket_name("123456789012", "us-east-1")).is_equal_to(expected_bucket_name)
+    # Subsequent lookups for the same account and region are served from the cache
+    cache_hits = _get_bucket_name.cache_info().hits
+    assert_that(S3Bucket.get_bucket_name("123456789012", "us-east-1")).is_equal_to(expected_bucket_name)
+    assert_that(_get_bucket_name.cache_info().hits).is_equal_to(cache_hits + 1)
+    assert_that(S3Bucket.get_bucket_name("123456789012", "eu-west-1")).is_not_equal_to(expected_bucket_name)
+
+
+@pytest.mark.parametrize("upload_file_error", [None, AWSClientError("upload_file", "An error occurred")])
+def test_upload_resources(mocker, tmp_path, upload_file_error):
+    mock_aws_api(mocker)
+    mock_bucket(mocker)
+    bucket = dummy_cluster_bucket()
+    (tmp_path / "resources_dir").mkdir()
+    (tmp_path / "resources_dir" / "handler.py").write_text("print('hello')")
+    file_names = [f"file-{index}.sh" for index in range(10)]
+    for file_name in file_names:
+        (tmp_path / file_name).write_text(file_name)
+
+    upload_fileobj_mock = mocker.patch("pcluster.aws.s3.S3Client.upload_fileobj")
+    upload_file_mock = mocker.patch("pcluster.aws.s3.S3Client.upload_file", side_effect=upload_file_error)
+
+    if upload_file_error:
+        with pytest.raises(AWSClientError, match="An error occurred"):
+            bucket.upload_resources(str(tmp_path), "artifacts.zip")
+    else:
+        bucket.upload_resources(str(tmp_path), "artifacts.zip")
+
+    upload_fileobj_mock.assert_called_once_with(
+        file_obj=mocker.ANY,
+        bucket_name=bucket.name,
+        key=bucket.get_object_key(S3FileType.CUSTOM_RESOURCES, "artifacts.zip"),
+    )
+    assert_that(upload_file_mock.call_count).is_equal_to(len(file_names))
+    for file_name in file_names:
+        upload_file_mock.assert_any_call(
+            file_path=os.path.join(str(tmp_path), file_name),
+            bucket_name=bucket.name,
+            key=bucket.get_object_key(S3FileType.CUSTOM_RESOURCES, file_name),
+        )
+
+
+@pytest.mark.parametrize(
+    "head_object_response, head_object_error, expect_upload",
+    [
+        pytest.param(
+            {"ETag": '"4c9d3d52b5b4d0a2bb6ac1a4b0b1f0c9"', "VersionId": "old-version"},
+            None,
+            True,
+            id="template changed",
+        ),
+        pytest.param(
+            {"ETag": '"{md5}"', "VersionId": "current-version"},
+            None,
+            False,
+            id="template unchanged",
+        ),
+        pytest.param(
+            None,
+            AWSClientError(function_name="head_object", message="Not Found", error_code="404"),
+            True,
+            id="template not uploaded yet",
+        ),
+    ],
+)
+def test_upload_cfn_template(mocker, head_object_response, head_object_error, expect_upload):
+    mock_aws_api(mocker)
+    mock_bucket(mocker)
+    bucket = dummy_cluster_bucket(bucket_name="test-bucket", artifact_directory="pcluster_artifact_directory")
+    template = {"Resources": {"Queue": {"Type": "AWS::SQS::Queue"}}}
+    template_body = format_content(template, S3FileFormat.YAML)
+    if head_object_response:
+        head_object_response["ETag"] = head_object_response["ETag"].format(
+            md5=hashlib.md5(template_body.encode("utf-8"), usedforsecurity=False).hexdigest()
+        )
+    head_object_mock = mocker.patch(
+        "pcluster.aws.s3.S3Client.head_object", return_value=head_object_response, side_effect=head_object_error
+    )
+    put_object_mock = mocker.patch("pcluster.aws.s3.S3Client.put_object", return_value={"VersionId": "new-version"})
+
+    result = bucket.upload_cfn_template(template, "test_template_name")
+
+    expected_key = "pcluster_artifact_directory/templates/test_template_name"
+    head_object_mock.assert_called_with(bucket_name="test-bucket", object_name=expected_key)
+    if expect_upload:
+        put_object_mock.assert_called_with(bucket_name="test-bucket", body=template_body, key=expected_key)
+        assert_that(result).is_equal_to({"VersionId": "new-version"})
+    else:
+        put_object_mock.assert_not_called()
+        assert_that(result).is_equal_to(head_object_response)
@@ -30,6 +30,7 @@ from pcluster.templates.cdk_builder_utils import (
     dict_to_cfn_tags,
     get_cluster_tags,
     get_default_volume_tags,
+    get_user_data_content,
 )
 from pcluster.utils import load_yaml_dict, split_resource_prefix
 from tests.pcluster.aws.dummy_aws_api import mock_aws_api
@@ -100,6 +101,19 @@ def test_get_default_volume_tags(stack_name, node_type, raw_dict, expected_resul
     assert_that(get_default_volume_tags(stack_name, node_type, raw_dict)).is_equal_to(expected_result)
 
 
+def test_get_user_data_content(mocker):
+    get_user_data_content.cache_clear()
+    open_spy = mocker.patch(
+        "pcluster.templates.cdk_builder_utils.open", mocker.mock_open(read_data="#!/bin/bash"), create=True
+    )
+
+    for _ in range(3):
+        assert_that(get_user_data_content("../resources/login_node/user_data.sh")).is_equal_to("#!/bin/bash")
+
+    open_spy.assert_called_once()
+    get_user_data_content.cache_clear()
+
+
 @pytest.mark.usefixtures("get_region")
 class TestCdkLaunchTemplateBuilder:
     @pytest.mark.parametrize(
@@ -13,6 +13,7 @@ import asyncio
 import os
 import time
 import unittest
+import zipfile
 from collections import namedtuple
 
 import pytest
@@ -460,6 +461,20 @@ def test_split_resource_prefix(resource_prefix, expected_output):
     assert_that(iam_role_prefix).is_equal_to(expected_output[1])
 
 
+@pytest.mark.parametrize("max_in_memory_size", [utils.ZIP_DIR_MAX_IN_MEMORY_SIZE, 1])
+def test_zip_dir(mocker, tmp_path, max_in_memory_size):
+    mocker.patch("pcluster.utils.ZIP_DIR_MAX_IN_MEMORY_SIZE", max_in_memory_size)
+    (tmp_path / "subdir").mkdir()
+    (tmp_path / "root_file.txt").write_text("root content")
+    (tmp_path / "subdir" / "nested_file.txt").write_text("nested content")
+
+    with utils.zip_dir(str(tmp_path)) as file_out:
+        assert_that(file_out.tell()).is_equal_to(0)
+        with zipfile.ZipFile(file_out) as archive:
+            assert_that(sorted(archive.namelist())).is_equal_to(["root_file.txt", "subdir/nested_file.txt"])
+            assert_that(archive.read("subdir/nested_file.txt").decode()).is_equal_to("nested content")
+
+
 Item = namedtuple("Item", "property")
 
 
@@ -712,7 +712,7 @@ def test_schedulable_memory_validator(schedulable_memory, ec2memory, instance_ty
     ],
 )
 def test_efa_validator(
-    mocker, boto3_stubber, instance_type, efa_enabled, gdr_support, efa_supported, multiaz_enabled, expected_message
+    mocker, instance_type, efa_enabled, gdr_support, efa_supported, multiaz_enabled, expected_message
 ):
     mock_aws_api(mocker)
     get_instance_type_info_mock = mocker.patch(
@@ -2369,7 +2369,6 @@ def test_deletion_policy_validator(deletion_policy, name, expected_message, fail
 )
 def test_efs_id_validator(
     mocker,
-    boto3_stubber,
     avail_zones_mapping,
     nodes_security_groups,
     security_groups,
@@ -326,4 +326,4 @@ def test_ec2_volume_validator(
 
 def test_ebs_allowed_values_all_have_volume_size_bounds():
     """Ensure that all known EBS volume types are accounted for by the volume size validator."""
-    assert_that(set(ALLOWED_VALUES["volume_type"]) <= set(EBS_VOLUME_TYPE_TO_VOLUME_SIZE_BOUNDS.keys())).is_true()
+    assert_that(EBS_VOLUME_TYPE_TO_VOLUME_SIZE_BOUNDS).contains_key(*ALLOWED_VALUES["volume_type"])
@@ -1370,7 +1370,9 @@ def test_placement_group_capacity_reservation_validator(
         "pcluster.aws.ec2.Ec2Client.describe_capacity_reservations",
         side_effect=lambda capacity_reservation_ids: capacity_reservations,
     )
-    mocker.patch("pcluster.aws.ec2.Ec2Client.get_subnet_avail_zone", return_value=desired_availability_zone)
+    get_subnet_avail_zone_mock = mocker.patch(
+        "pcluster.aws.ec2.Ec2Client.get_subnet_avail_zone", return_value=desired_availability_zone
+    )
     actual_failure = PlacementGroupCapacityReservationValidator().execute(
         placement_group=placement_group,
         odcr=odcr,
@@ -1380,6 +1382,7 @@ def test_placement_group_capacity_reservation_validator(
         subnet_id_az_mapping=subnet_id_az_mapping,
     )
     assert_failure_messages(actual_failure, expected_message)
+    assert_that(get_subnet_avail_zone_mock.call_count).is_less_than_or_equal_to(1)
 
 
 @pytest.mark.parametrize(
@@ -12,7 +12,9 @@ import os
 from collections import defaultdict
 
 import pytest
+from assertpy import assert_that
 
+from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.common import AWSClientError
 from pcluster.validators.networking_validators import (
     ElasticIpValidator,
@@ -27,32 +29,40 @@ from tests.pcluster.aws.dummy_aws_api import mock_aws_api
 from tests.pcluster.validators.utils import assert_failure_messages
 
 
-def test_ec2_security_group_validator(mocker):
+@pytest.mark.parametrize(
+    "security_group_ids, invalid_security_group_ids, expected_message",
+    [
+        (["sg-12345678", "sg-23456789"], [], None),
+        (
+            ["sg-12345678", "sg-23456789", "sg-34567890"],
+            ["sg-23456789", "sg-34567890"],
+            ["The security group 'sg-23456789' does not exist", "The security group 'sg-34567890' does not exist"],
+        ),
+    ],
+)
+def test_ec2_security_group_validator(mocker, security_group_ids, invalid_security_group_ids, expected_message):
     os.environ["AWS_DEFAULT_REGION"] = "us-east-1"
-    describe_security_group_mock = mocker.patch(
-        "pcluster.aws.ec2.Ec2Client.describe_security_group",
-        return_value={
-            "IpPermissionsEgress": [],
-            "Description": "My security group",
-            "IpPermissions": [
-                {
-                    "PrefixListIds": [],
-                    "FromPort": 22,
-                    "IpRanges": [{"CidrIp": "203.0.113.0/24"}],
-                    "ToPort": 22,
-                    "IpProtocol": "tcp",
-                    "UserIdGroupPairs": [],
-                }
-            ],
-            "GroupName": "MySecurityGroup",
-            "OwnerId": "123456789012",
-            "GroupId": "sg-12345678",
-        },
+
+    def _describe_security_groups(security_group_ids):
+        for security_group_id in security_group_ids:
+            if security_group_id in invalid_security_group_ids:
+                raise AWSClientError(
+                    "describe_security_groups", f"The security group '{security_group_id}' does not exist"
+                )
+        return [
+            {"GroupId": security_group_id, "GroupName": "MySecurityGroup", "OwnerId": "123456789012"}
+            for security_group_id in security_group_ids
+        ]
+
+    describe_security_groups_mock = mocker.patch(
+        "pcluster.aws.ec2.Ec2Client.describe_security_groups", side_effect=_describe_security_groups
     )
 
-    actual_failures = SecurityGroupsValidator().execute(["sg-12345678"])
-    assert_failure_messages(actual_failures, None)
-    describe_security_group_mock.assert_called_with("sg-12345678")
+    actual_failures = SecurityGroupsValidator().execute(security_group_ids)
+    assert_failure_messages(actual_failures, expected_message)
+    describe_security_groups_mock.assert_any_call(security_group_ids)
+    if not invalid_security_group_ids:
+        describe_security_groups_mock.assert_called_once()
 
 
 def test_ec2_subnet_id_validator(mocker):
@@ -60,9 +70,34 @@ def test_ec2_subnet_id_validator(mocker):
     mocker.patch("pcluster.aws.ec2.Ec2Client.is_enable_dns_support", return_value=True)
     mocker.patch("pcluster.aws.ec2.Ec2Client.is_enable_dns_hostnames", return_value=True)
 
+    describe_subnets_spy = mocker.spy(AWSApi.instance().ec2, "describe_subnets")
+
     # TODO test with invalid key
-    actual_failures = SubnetsValidator().execute(["subnet-12345678", "subnet-23456789"])
+    actual_failures = SubnetsValidator().execute(["subnet-12345678", "subnet-23456789", "subnet-12345678"])
     assert_failure_messages(actual_failures, None)
+    describe_subnets_spy.assert_called_once_with(subnet_ids=["subnet-12345678", "subnet-23456789"])
+
+
+def test_ec2_subnet_id_validator_with_multiple_vpcs(mocker):
+    mock_aws_api(mocker)
+    mocker.patch.object(
+        AWSApi.instance().ec2,
+        "describe_subnets",
+        return_value=[
+            {"SubnetId": "subnet-12345678", "VpcId": "vpc-12345678"},
+            {"SubnetId": "subnet-23456789", "VpcId": "vpc-23456789"},
+        ],
+    )
+    dns_support_mock = mocker.patch("pcluster.aws.ec2.Ec2Client.is_enable_dns_support", return_value=True)
+    dns_hostnames_mock = mocker.patch("pcluster.aws.ec2.Ec2Client.is_enable_dns_hostnames", return_value=True)
+
+    actual_failures = SubnetsValidator().execute(["subnet-12345678", "subnet-23456789"])
+    assert_failure_messages(
+        actual_failures,
+        "Subnet subnet-23456789 is not in VPC vpc-12345678. Please make sure all subnets are in the same VPC.",
+    )
+    dns_support_mock.assert_not_called()
+    dns_hostnames_mock.assert_not_called()
 
 
 @pytest.mark.parametrize(
@@ -263,6 +298,7 @@ def test_lambda_functions_vpc_config_validator(
 
     actual_response = LambdaFunctionsVpcConfigValidator().execute(security_group_ids, subnet_ids)
     assert_failure_messages(actual_response, expected_response)
+    assert_that(actual_response).is_length(1 if expected_response else 0)
 
 
 @pytest.mark.parametrize(
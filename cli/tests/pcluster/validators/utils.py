@@ -21,10 +21,12 @@ def assert_failure_messages(actual_failures, expected_messages):
         if isinstance(expected_messages, str):
             expected_messages = [expected_messages]
         for expected_message in expected_messages:
-            # Either check the regex of expected_message match actual failure or check the whole strings are equal.
+            # Either check the whole strings are equal or check the regex of expected_message match actual failure.
             # This is to deal with strings having regex symbols (e.g. "[") inside
-            res = any(re.search(expected_message, actual_failure.message) for actual_failure in actual_failures) or any(
-                expected_message == actual_failure.message for actual_failure in actual_failures
+            # The string comparison comes first because it is cheaper than a regex search
+            res = any(
+                expected_message == actual_failure.message or re.search(expected_message, actual_failure.message)
+                for actual_failure in actual_failures
             )
             # PyTest truncates the full expected & failure messages if there is an error
             # These print statements ensure the full message is shown in the console if there is an assertion error